@@ -31,7 +31,6 @@ import abc
 from collections.abc import Hashable, Mapping, MutableMapping
 import contextlib
 import dataclasses
-import inspect
 import pathlib
 from typing import Any, Callable, ClassVar, Optional
 
@@ -321,13 +320,13 @@ class Manager(framework.Resource, abc.ABC):
         
     def _validate_idea(self) -> None:
         """Creates or validates 'project.idea'."""
-        if inspect.isclass(self.project.idea):
+        if isinstance(self.project.idea, type):
             self.project.idea = self.project.idea()
-        elif not isinstance(self.project.idea, base.Idea):
-            base = base.Idea
+        elif not isinstance(self.project.idea, framework.Idea):
+            base = framework.Idea
             self.project.idea = base.create(
                 source = self.project.idea,
-                default = base.Defaults.settings)        
+                defaults = framework.Defaults.settings)        
         return
 
     def _infer_project_name(self) -> Optional[str]:
@@ -353,7 +352,7 @@ class Manager(framework.Resource, abc.ABC):
         elif isinstance(self.manager, str):
             self.librarian = framework.Resources.librarian[
                 self.librarian]
-        if inspect.isclass(self.librarian):
+        if isinstance(self.librarian, type):
             self.librarian = self.librarian(project = self)
         else:
             self.librarian.project = self
@@ -369,8 +368,9 @@ class Manager(framework.Resource, abc.ABC):
         if ('general' in self.project.idea
                 and 'parallelize' in self.project.idea['general'] 
                 and self.project.idea['general']['parallelize']):
-            if not globals()['multiprocessing']:
-                import multiprocessing
+            # Imported here because 'multiprocessing' is slow to import and
+            # is only needed when parallelization is enabled.
+            import multiprocessing
             multiprocessing.set_start_method('spawn') 
         return 
         
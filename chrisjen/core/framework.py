@@ -32,14 +32,17 @@ import abc
 from collections.abc import Hashable, Mapping, MutableMapping
 import contextlib
 import dataclasses
-import pathlib
-from typing import Any, ClassVar, Optional, Type
+from typing import Any, ClassVar, Optional, Type, TYPE_CHECKING
 import warnings
 
 import ashford
 import bobbie
 import camina
-import holden
+
+if TYPE_CHECKING:
+    import pathlib
+    
+    import holden
 
    
 @dataclasses.dataclass
@@ -101,19 +101,22 @@ class Parameters(camina.Dictionary):
                 settings parameters can be derived.
             
         """
-        # Uses kwargs and 'default' parameters as a starting camina.
-        parameters = self.default
-        # Adds any parameters from 'outline'.
-        parameters.update(self._from_outline(item = item))
-        # Adds any implementation parameters.
-        parameters.update(self._at_runtime(item = item))
-        # Adds any parameters already stored in 'contents'.
-        parameters.update(self.contents)
-        # Adds any passed kwargs, which will override any other parameters.
-        parameters.update(kwargs)
+        implementation = self.implementation
+        selected = self.selected
+        # Adds any implementation parameters to 'contents'.
+        if implementation:
+            self._at_runtime(item = item)
+        # Merges, in order of increasing priority, 'default' parameters, 
+        # parameters from 'outline', parameters already stored in 'contents', 
+        # and passed kwargs. Building a new dict leaves 'default' unchanged.
+        parameters = {
+            **self.default, 
+            **self._from_outline(project = item), 
+            **self.contents, 
+            **kwargs}
         # Limits parameters to those in 'selected'.
-        if self.selected:
-            parameters = {k: parameters[k] for k in self.selected}
+        if selected:
+            parameters = {k: parameters[k] for k in selected}
         self.contents = parameters
         return self
 
@@ -129,17 +132,20 @@ class Parameters(camina.Dictionary):
             dict[str, Any]: any applicable outline parameters or an empty dict.
             
         """
+        # Each 'outline' property is rebuilt from 'project.idea' when accessed,
+        # so each is only accessed once here.
+        outline = project.outline
+        implementation = outline.implementation
         keys = [self.name]
-        keys.append(project.outline.kinds[self.name])
-        try:
-            keys.append(project.outline.designs[self.name])
-        except KeyError:
-            pass
+        kinds = outline.kinds
+        if self.name in kinds:
+            keys.append(kinds[self.name])
+        designs = outline.designs
+        if self.name in designs:
+            keys.append(designs[self.name])
         for key in keys:
-            try:
-                return project.outline.implementation[key]
-            except KeyError:
-                pass
+            if key in implementation:
+                return implementation[key]
         return {}
    
     def _at_runtime(self, item: Any) -> dict[str, Any]:
@@ -153,15 +159,14 @@ class Parameters(camina.Dictionary):
             dict[str, Any]: any applicable idea parameters or an empty dict.
                    
         """    
+        # 'implementation' and the attributes of 'item' are read on every call
+        # so that changes to either are never missed.
         for parameter, attribute in self.implementation.items():
             try:
                 self.contents[parameter] = getattr(item, attribute)
             except AttributeError:
-                try:
-                    self.contents[parameter] = (
-                        item.idea['general'][attribute])
-                except (KeyError, AttributeError):
-                    pass
+                with contextlib.suppress(KeyError, AttributeError):
+                    self.contents[parameter] = item.idea['general'][attribute]
         return self
     
 
@@ -345,10 +350,10 @@ class Worker(resources.Node):
                 instance of 'Project'.
             
         """
+        # Binds 'withdraw' once rather than looking it up for every node.
+        withdraw = self.project.library.withdraw
         for name in self.walk:
-            node = self.project.library.withdraw(
-                item = name,
-                parameters = {})
+            node = withdraw(item = name, parameters = {})
             item = node.complete(item, **kwargs)
         return item
   
@@ -465,11 +470,15 @@ class Task(resources.Node):
                 instance of 'Project'.
             
         """
-        try:
-            item = self.contents.complete(item = item, **kwargs)
-        except AttributeError:
-            item = self.contents(item, **kwargs)
-        return item   
+        contents = self.contents
+        # Looks up 'complete' with a default rather than catching an 
+        # AttributeError so that plain callables do not raise and catch an 
+        # exception on every call.
+        complete = getattr(contents, 'complete', None)
+        if complete is None:
+            return contents(item, **kwargs)
+        else:
+            return complete(item = item, **kwargs)
    
     
 @dataclasses.dataclass
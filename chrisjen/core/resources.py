@@ -31,8 +31,8 @@ import abc
 from collections.abc import Hashable, Mapping, MutableMapping
 import contextlib
 import dataclasses
-import inspect
 import pathlib
+import sys
 from typing import Any, Callable, ClassVar, Optional
 
 import ashford
@@ -156,16 +156,21 @@ class Librarian(framework.Resource, abc.ABC):
             list[str]: _description_
             
         """
-        if name in framework.Defaults.null_node_names:
+        if name in framework.Defaults.null_nodes:
             return ['null_node']
         else:
             keys = [name]
-            if name in self.project.outline.designs:
-                keys.append(self.project.outline.designs[name])
+            # 'designs' and 'kinds' are rebuilt from 'project.idea' on each 
+            # access, so each is read only once.
+            outline = self.project.outline
+            designs = outline.designs
+            kinds = outline.kinds
+            if name in designs:
+                keys.append(designs[name])
             elif name is self.project.name:
                 keys.append(framework.Defaults.workflow)
-            if name in self.project.outline.kinds:
-                keys.append(self.project.outline.kinds[name])
+            if name in kinds:
+                keys.append(kinds[name])
             return keys
     
     def _get_node(self, lookups: list[str]) -> Node:
@@ -180,11 +185,10 @@ class Librarian(framework.Resource, abc.ABC):
         Returns:
             Node: _description_
         """
+        library = self.project.library.node
         for key in lookups:
-            try:
-                return self.project.library.node[key]
-            except KeyError:
-                pass
+            if key in library:
+                return library[key]
         raise KeyError(f'No matching node found for these: {lookups}')  
               
 
@@ -198,12 +202,20 @@ class Manager(framework.Resource, abc.ABC):
         clerk (Optional[nagata.FileManager]): file manager. Defaults to None.
         librarian (Optional[Librarian]): class to access stored keystones. 
             Defaults to None.
+            
+    Attributes:
+        completed (bool): whether the 'complete' method has already been 
+            applied to 'project'. It allows subclasses to avoid repeating all
+            of the project stages if 'complete' is called again after being 
+            automatically called at initialization. Defaults to False.
              
     """
     project: Optional[framework.Project] = dataclasses.field(
         default = None, repr = False, compare = False)
     clerk: Optional[nagata.FileManager] = None
     librarian: Optional[Librarian] = None
+    completed: bool = dataclasses.field(
+        default = False, init = False, repr = False, compare = False)
     
     """ Initialization Methods """
 
@@ -299,9 +311,8 @@ class Manager(framework.Resource, abc.ABC):
         
         """
         if self.project.identification is None:
-            prefix = self.project.name + '_'
             self.project.identification = miller.how_soon_is_now(
-                prefix = prefix)
+                prefix = f'{self.project.name}_')
         elif not isinstance(self.project.identification, str):
             raise TypeError('identification must be a str or None type')
         return
@@ -320,7 +331,7 @@ class Manager(framework.Resource, abc.ABC):
         
     def _validate_idea(self) -> None:
         """Creates or validates 'project.idea'."""
-        if inspect.isclass(self.project.idea):
+        if isinstance(self.project.idea, type):
             self.project.idea = self.project.idea()
         elif not isinstance(self.project.idea, framework.Idea):
             base = framework.Idea
@@ -352,7 +363,7 @@ class Manager(framework.Resource, abc.ABC):
         elif isinstance(self.manager, str):
             self.librarian = ashford.Keystones.librarian[
                 self.librarian]
-        if inspect.isclass(self.librarian):
+        if isinstance(self.librarian, type):
             self.librarian = self.librarian(project = self)
         else:
             self.librarian.project = self
@@ -368,8 +379,9 @@ class Manager(framework.Resource, abc.ABC):
         if ('general' in self.project.idea
                 and 'parallelize' in self.project.idea['general'] 
                 and self.project.idea['general']['parallelize']):
-            if not globals()['multiprocessing']:
-                import multiprocessing
+            # Imported here because 'multiprocessing' is slow to import and
+            # is only needed when parallelization is enabled.
+            import multiprocessing
             multiprocessing.set_start_method('spawn') 
         return 
         
@@ -432,6 +444,16 @@ class Node(holden.Labeled, framework.Resource, Hashable, abc.ABC):
         cls.__hash__ = Node.__hash__ # type: ignore
         cls.__eq__ = Node.__eq__ # type: ignore
         cls.__ne__ = Node.__ne__ # type: ignore  
+
+    def __post_init__(self) -> None:
+        """Initializes and validates an instance."""
+        # Calls parent and/or mixin initialization method(s).
+        with contextlib.suppress(AttributeError):
+            super().__post_init__()
+        # Interns 'name' so that equal names are usually the same object, which
+        # lets '__eq__' and dict lookups succeed on an identity check.
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
                                       
     """ Public Methods """
     
@@ -447,8 +469,12 @@ class Node(holden.Labeled, framework.Resource, Hashable, abc.ABC):
                 instance of 'Project'.
             
         """
-        with contextlib.suppress(AttributeError):
-            self.parameters.finalize(item = item)
+        # Plain dict parameters have nothing to finalize. Looking 'finalize' up
+        # with a default, rather than suppressing AttributeError, keeps errors
+        # raised inside 'finalize' from being silently discarded.
+        finalize = getattr(self.parameters, 'finalize', None)
+        if finalize is not None:
+            finalize(item = item)
         return self.implement(item = item, **self.parameters, **kwargs)
     
     @classmethod
@@ -498,10 +524,20 @@ class Node(holden.Labeled, framework.Resource, Hashable, abc.ABC):
             bool: whether 'name' is the same as 'other.name'.
             
         """
+        if self is other:
+            return True
+        name = self.name
         try:
-            return str(self.name) == str(other.name) # type: ignore
+            other_name = other.name # type: ignore
         except AttributeError:
-            return str(self.name) == other
+            return str(name) == other
+        # Avoids creating new str objects when both names are already str.
+        if name is other_name:
+            return True
+        elif type(name) is str and type(other_name) is str:
+            return name == other_name
+        else:
+            return str(name) == str(other_name)
 
     def __ne__(self, other: object) -> bool:
         """Completes equality test dunder methods.
@@ -516,23 +552,20 @@ class Node(holden.Labeled, framework.Resource, Hashable, abc.ABC):
         return not(self == other)
 
     def __contains__(self, item: Any) -> bool:
-        """Returns whether 'item' is in or equal to 'contents'.
+        """Returns whether 'item' is in or is 'contents'.
 
         Args:
             item (Any): item to check versus 'contents'
             
         Returns:
-            bool: if 'item' is in or equal to 'contents' (True). Otherwise, it
-                returns False.
+            bool: if 'item' is in 'contents' or, when 'contents' is not a 
+                container, is 'contents' (True). Otherwise, it returns False.
 
         """
         try:
             return item in self.contents
         except TypeError:
-            try:
-                return item is self.contents
-            except TypeError:
-                return item == self.contents 
+            return item is self.contents
     
     def __hash__(self) -> int:
         """Makes Node hashable so that it can be used as a key in a dict.
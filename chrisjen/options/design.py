@@ -41,9 +41,8 @@ def arrrange_parallel(
     steps = project.connections[name]
     connections = project.connections[name]
     possible = [connections[s] for s in steps]
-    combos = list(itertools.product(*possible))   
     step_tasks = []
-    for combo in combos:
+    for combo in itertools.product(*possible):
         recipe = []
         for i, task in enumerate(combo):
             recipe.append((steps[i], task))
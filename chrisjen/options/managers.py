@@ -55,10 +55,17 @@ class Publisher(resources.Manager):
     """ Public Methods """
         
     def complete(self) -> None:
-        """Completes all stages in 'project'."""
-        self.draft()
-        self.publish()
-        self.execute()
+        """Completes all stages in 'project' if not already completed.
+        
+        Later calls are no-ops, even if 'project' has changed. To re-run all of
+        the stages, set 'completed' to False before calling this method again.
+        
+        """
+        if not self.completed:
+            self.draft()
+            self.publish()
+            self.execute()
+            self.completed = True
         return
         
     def draft(self) -> None:
@@ -27,7 +27,6 @@ from __future__ import annotations
 from collections.abc import (
     Hashable, Mapping, MutableMapping, MutableSequence, Set)
 import dataclasses
-import inspect
 from typing import Any, ClassVar, Optional, Type, TYPE_CHECKING, Union
 
 import camina
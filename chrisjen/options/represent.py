@@ -59,9 +59,8 @@ def represent_parallel(
     connections = project.outline.connections
     steps = connections[name]
     techniques = [connections[s] for s in steps]
-    combos = list(itertools.product(*techniques)) 
     recipes = [] 
-    for combo in combos:
+    for combo in itertools.product(*techniques):
         recipes.append([tuple([steps[i], t]) for i, t in enumerate(combo)])
     return recipes
 
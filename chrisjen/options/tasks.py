@@ -119,20 +119,28 @@ class Step(nodes.Task):
                 instance of 'Project'.
             
         """
-        if self.contents not in [None, 'None', 'none']:
+        contents = self.contents
+        # Checks identity and str type first so that 'contents' is never 
+        # compared, through its own '__eq__', against each null value.
+        if not (contents is None or (
+                type(contents) is str 
+                and contents in framework.Defaults.null_nodes)):
+            # Copies stored parameters into a new dict so that 'kwargs' and
+            # technique parameters are not written back into 'parameters'.
             if self.parameters:
-                if hasattr(self.parameters, 'finalize'):
-                    self.parameters.finalize(project = project)
-                parameters = self.parameters
-                parameters.update(kwargs)
+                finalize = getattr(self.parameters, 'finalize', None)
+                if finalize is not None:
+                    finalize(item = item)
+                parameters = {**self.parameters, **kwargs}
             else:
                 parameters = kwargs
-            if self.technique.parameters:
-                if hasattr(self.technique.parameters, 'finalize'):
-                    self.technique.parameters.finalize(project = project)
-                technique_parameters = self.technique.parameters
+            technique_parameters = contents.parameters
+            if technique_parameters:
+                finalize = getattr(technique_parameters, 'finalize', None)
+                if finalize is not None:
+                    finalize(item = item)
                 parameters.update(technique_parameters)  
-            self.technique.implement(item = item, **parameters)
+            contents.implement(item = item, **parameters)
         return item
         
                                                   
@@ -24,7 +24,6 @@ from __future__ import annotations
 import abc
 from collections.abc import (
     Callable, Hashable, Mapping, MutableMapping, MutableSequence, Sequence)
-import inspect
 from typing import Any, ClassVar, Optional, Type, TYPE_CHECKING, Union
 
 import camina
@@ -55,6 +55,11 @@ class Outline(resources.View):
         name
         project (structure.Project): a related project instance which has data
             from which the properties of an Outline can be derived.
+            
+    Attributes:
+        cached_plurals (Optional[tuple[int, tuple[str, ...]]]): the number of
+            registered node classes and the 'plurals' built from them. It is
+            rebuilt by 'plurals' whenever that number changes. Defaults to None.
 
     """
     name: Optional[str] = None
@@ -62,6 +67,8 @@ class Outline(resources.View):
         default = None, repr = False, compare = False)
     defaults: Optional[dict[str, tuple[str]]] = dataclasses.field(
         default_factory = lambda: framework.Defaults.parsers)
+    cached_plurals: Optional[tuple[int, tuple[str, ...]]] = dataclasses.field(
+        default = None, init = False, repr = False, compare = False)
     
     """ Properties """       
                      
@@ -141,12 +148,7 @@ class Outline(resources.View):
             dict[str, Any]: dict of file settings.
             
         """
-        for name in self.defaults['files']:
-            try:
-                return self[name]
-            except KeyError:
-                pass
-        return {} 
+        return self._get_section(kind = 'files') 
                             
     @property
     def manager(self) -> dict[str, Any]:
@@ -173,12 +175,7 @@ class Outline(resources.View):
             dict[str, Any]: dict of general settings.
             
         """       
-        for name in self.defaults['general']:
-            try:
-                return self[name]
-            except KeyError:
-                pass
-        return {}  
+        return self._get_section(kind = 'general')  
                                     
     @property
     def implementation(self) -> dict[str, dict[str, Any]]:
@@ -266,13 +263,22 @@ class Outline(resources.View):
     def plurals(self) -> tuple[str]:
         """Returns all node names as naive plurals of those names.
         
+        Unlike the other properties, the result is cached because it depends
+        only on the registered node classes, not on 'project.idea', and it is
+        read by nearly every other property. The cache is rebuilt when a node
+        class is registered after the first access.
+        
         Returns:
             tuple[str]: all node names with an 's' added in order to create 
                 simple plurals combined with the stored keys.
                 
         """
-        plurals = [k + 's' for k in self.project.library.node.keys()]
-        return tuple(plurals ) 
+        library = self.project.library.node
+        size = len(library)
+        if self.cached_plurals is None or self.cached_plurals[0] != size:
+            plurals = tuple(f'{k}s' for k in library.keys())
+            self.cached_plurals = (size, plurals)
+        return self.cached_plurals[1]
     
     @property
     def workers(self) -> dict[str, dict[str, Any]]:
@@ -293,6 +299,28 @@ class Outline(resources.View):
                     name = name[:-8]
                 sections[name] = section
         return sections
+
+    """ Private Methods """
+    
+    def _get_section(self, kind: str) -> dict[str, Any]:
+        """Returns the first section in 'project.idea' named in 'defaults'.
+
+        Membership is checked directly so that missing section names do not
+        raise and catch a KeyError for each candidate name.
+        
+        Args:
+            kind (str): key in 'defaults' with the possible section names.
+
+        Returns:
+            dict[str, Any]: matching section or an empty dict if there is no
+                match.
+            
+        """
+        idea = self.project.idea
+        for name in self.defaults[kind]:
+            if name in idea:
+                return idea[name]
+        return {}
     
 
 @dataclasses.dataclass
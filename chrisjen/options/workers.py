@@ -116,8 +116,7 @@ class Research(holden.Parallel, abc.ABC):
         connections = project.connections[name]
         steps = connections[name]
         possible = [connections[s] for s in steps]
-        combos = list(itertools.product(*possible))   
-        for combo in combos:
+        for combo in itertools.product(*possible):
             recipe = project.manager.librarian.acquire(name = 'worker')
             for i, task in enumerate(combo):
                 step = project.manager.librarian.acquire(
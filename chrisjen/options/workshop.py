@@ -201,7 +201,7 @@ def represent_researcher(
     """ 
     base = base or project.base.node.library['researcher']
     section = project.idea[name]
-    first_key = list(item.keys())[0]
+    first_key = next(iter(item))
     self.append(first_key)
     possible = [v for k, v in item.items() if k in item[first_key]]
     combos = list(itertools.product(*possible))
@@ -693,14 +693,11 @@ def _finalize_implementation(
         dict[Hashable, Any]: [description]
         
     """        
-    parameters = {}
+    implementation = project.outline.implementation
     for key in lookups:
-        try:
-            parameters = copy.deepcopy(project.outline.implementation[key])
-            break
-        except KeyError:
-            pass
-    return parameters
+        if key in implementation:
+            return copy.deepcopy(implementation[key])
+    return {}
 
 def _finalize_initializaton(
     lookups: list[str], 
@@ -717,12 +714,11 @@ def _finalize_initializaton(
         
     """  
     parameters = {}
+    initialization = project.outline.initialization
     for key in lookups:
-        try:
-            parameters = copy.deepcopy(project.outline.initialization[key])
+        if key in initialization:
+            parameters = copy.deepcopy(initialization[key])
             break
-        except KeyError:
-            pass 
     if parameters:
         kwargs_added = parameters
         kwargs_added.update(**kwargs)
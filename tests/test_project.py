@@ -26,6 +26,7 @@ To Do:
 from __future__ import annotations
 import dataclasses
 import pathlib
+import types
 
 import chrisjen
 import holden
@@ -135,6 +136,57 @@ def test_project():
     return
 
 
+@dataclasses.dataclass
+class CountingPublisher(chrisjen.Publisher):
+
+    calls: list[str] = dataclasses.field(default_factory = list)
+
+    def __post_init__(self) -> None:
+        return
+
+    def draft(self) -> None:
+        self.calls.append('draft')
+        return
+
+    def publish(self) -> None:
+        self.calls.append('publish')
+        return
+
+    def execute(self) -> None:
+        self.calls.append('execute')
+        return
+
+
+def test_publisher_complete():
+    manager = CountingPublisher(project = None)
+    manager.complete()
+    manager.complete()
+    assert manager.calls == ['draft', 'publish', 'execute']
+    manager.completed = False
+    manager.complete()
+    assert manager.calls == ['draft', 'publish', 'execute'] * 2
+    return
+
+
+def test_parameters_finalize():
+    outline = types.SimpleNamespace(
+        implementation = {'scale': {'b': 1, 'c': 1, 'd': 1}},
+        kinds = {},
+        designs = {})
+    item = types.SimpleNamespace(outline = outline)
+    default = {'a': 0, 'b': 0, 'c': 0, 'd': 0}
+    parameters = chrisjen.Parameters(
+        name = 'scale',
+        default = default,
+        contents = {'c': 2, 'd': 2})
+    parameters.finalize(item = item, d = 3)
+    parameters.finalize(item = item)
+    assert default == {'a': 0, 'b': 0, 'c': 0, 'd': 0}
+    assert parameters.default == {'a': 0, 'b': 0, 'c': 0, 'd': 0}
+    assert parameters.contents == {'a': 0, 'b': 1, 'c': 2, 'd': 3}
+    return
+
+
 if __name__ == '__main__':
     test_project()
     
\ No newline at end of file